@@ -22,7 +22,6 @@
 #
 """CODEC for converting ADM to and from YANG form."""
 
-import io
 import logging
 import math
 import optparse
@@ -172,7 +171,7 @@ class AriTextDecoder:
 
     def decode(self, text: str) -> ARI:
         """Decode ARI text and resolve any relative reference."""
-        ari = self._ari_dec.decode(io.StringIO(text))
+        ari = self._ari_dec.decode_str(text)
         if self._ns_id is not None:
             ari = ari.map(RelativeResolver(*self._ns_id))
         return ari
@@ -51,6 +51,10 @@ apiIntInterval = portion.create_api(IntInterval)
 
 INT_ENVELOPE = apiIntInterval.closedopen(-(2**63), 2**64)
 """ Envelope for union of all valid integer types """
+INT_ENVELOPE_MIN = INT_ENVELOPE.lower
+""" Smallest integer within :py:data:`INT_ENVELOPE` """
+INT_ENVELOPE_MAX = INT_ENVELOPE.upper
+""" Largest integer within :py:data:`INT_ENVELOPE` """
 
 
 def _is_nan(val) -> bool:
@@ -69,6 +73,9 @@ class Table(numpy.ndarray):
         return super().__new__(self, shape, dtype=ARI)
 
     def __eq__(self, other: "Table"):
+        if isinstance(other, numpy.ndarray):
+            # compare cells directly without an intermediate object array
+            return self.shape == other.shape and self.tolist() == other.tolist()
         return numpy.array_equal(self, other)
 
     @staticmethod
@@ -151,24 +158,43 @@ class ObjectRefPattern:
     obj_pat: PartType
     """ Object ID matching """
 
+    def __post_init__(self):
+        # flatten integer intervals once so that matching is plain comparisons
+        match_parts = tuple(
+            self._flatten_part(pat) for pat in (self.org_pat, self.model_pat, self.type_pat, self.obj_pat)
+        )
+        object.__setattr__(self, "_match_parts", match_parts)
+
     def is_match(self, ident: "Identity") -> bool:
         """Determine if an identity with numeric parts matches this pattern."""
+        org_pat, model_pat, type_pat, obj_pat = self._match_parts
         return (
-            self._part_match(self.org_pat, ident.org_id)
-            and self._part_match(self.model_pat, ident.model_id)
-            and self._part_match(self.type_pat, ident.type_id)
-            and self._part_match(self.obj_pat, ident.obj_id)
+            self._part_match(org_pat, ident.org_id)
+            and self._part_match(model_pat, ident.model_id)
+            and self._part_match(type_pat, ident.type_id)
+            and self._part_match(obj_pat, ident.obj_id)
         )
 
     @staticmethod
-    def _part_match(pat: PartType, ident: "Identity.PartType") -> bool:
+    def _flatten_part(pat: PartType):
+        if isinstance(pat, IntInterval):
+            # discrete intervals have closed bounds except at infinity
+            return tuple((intvl.lower, intvl.upper) for intvl in pat)
+        return pat
+
+    @staticmethod
+    def _part_match(pat, ident: "Identity.PartType") -> bool:
         if pat is True:
             # wildcard
             return True
         elif isinstance(pat, str):
             return pat == ident
-        elif isinstance(pat, IntInterval):
-            return ident in pat
+        elif isinstance(pat, tuple):
+            if isinstance(ident, int):
+                for lower, upper in pat:
+                    if lower <= ident <= upper:
+                        return True
+            return False
         else:
             raise TypeError("bad internal state")
 
@@ -295,8 +321,21 @@ class LiteralARI(ARI):
         )
 
     def __hash__(self) -> int:
+        # instances are immutable, so compute the hash only once
+        try:
+            return self.__dict__["_hash"]
+        except KeyError:
+            pass
         # ensure that bool is hashed differently than int
-        return hash((self.type_id, type(self.value), self.value))
+        value = hash((self.type_id, type(self.value), self.value))
+        object.__setattr__(self, "_hash", value)
+        return value
+
+    def __getstate__(self) -> dict:
+        # string hashes are not stable between processes
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
 
     def visit(self, visitor: Callable[["ARI"], None]) -> None:
         if isinstance(self.value, (tuple, list)):
@@ -34,6 +34,8 @@ from ace.ari import (
     ARI,
     DTN_EPOCH,
     INT_ENVELOPE,
+    INT_ENVELOPE_MAX,
+    INT_ENVELOPE_MIN,
     ExecutionSet,
     Identity,
     LiteralARI,
@@ -244,7 +246,7 @@ class Decoder:
         elif type_id is None:
             # any other type or untyped primitive value
             if isinstance(item, int):
-                if item not in INT_ENVELOPE:
+                if not INT_ENVELOPE_MIN <= item <= INT_ENVELOPE_MAX:
                     raise ValueError(f"Integer value {item} is outside valid interval {INT_ENVELOPE}")
             value = item
         else:
@@ -24,7 +24,7 @@
 
 import logging
 import os
-from typing import TextIO
+from typing import Iterable, Iterator, TextIO
 
 try:
     import xdg_base_dirs
@@ -52,7 +52,11 @@ class ParseError(RuntimeError):
 
 
 class Decoder:
-    """The decoder portion of this CODEC."""
+    """The decoder portion of this CODEC.
+
+    The lexer and parser are constructed on first use and reused for all
+    later decoding, so an instance must not be shared between threads.
+    """
 
     def __init__(self):
         self._cache_path = os.path.join(xdg_base_dirs.xdg_cache_home(), "ace", "ply")
@@ -60,6 +64,8 @@ class Decoder:
             os.makedirs(self._cache_path)
         LOGGER.debug("cache at %s", self._cache_path)
         self._pickle_path = os.path.join(self._cache_path, "parse.pickle")
+        self._lexer = None
+        self._parser = None
 
     def decode(self, buf: TextIO) -> ARI:
         """Decode an ARI from UTF8 text.
@@ -68,12 +74,37 @@ class Decoder:
         :return: The decoded ARI.
         :throw ParseError: If there is a problem with the input text.
         """
-        text = buf.read()
+        return self.decode_str(buf.read())
+
+    def decode_str(self, text: str) -> ARI:
+        """Decode an ARI from a text string.
+
+        :param text: The text to decode.
+        :return: The decoded ARI.
+        :throw ParseError: If there is a problem with the input text.
+        """
+        return self._parse(text)
+
+    def decode_many(self, texts: Iterable[str]) -> Iterator[ARI]:
+        """Decode a sequence of ARIs from UTF8 text strings.
+
+        :param texts: The text strings to decode, each containing one ARI.
+        :return: An iterator over the decoded ARIs, in the same order.
+        :throw ParseError: If there is a problem with any input text.
+        """
+        for text in texts:
+            yield self._parse(text)
+
+    def _parse(self, text: str) -> ARI:
+        if self._parser is None:
+            # parse tables are loaded from the pickle cache only once
+            self._lexer = new_lexer()
+            self._parser = new_parser(
+                debug=False, errorlog=LOGGER, outputdir=self._cache_path, picklefile=self._pickle_path
+            )
 
-        lexer = new_lexer()
-        parser = new_parser(debug=False, errorlog=LOGGER, outputdir=self._cache_path, picklefile=self._pickle_path)
         try:
-            res = parser.parse(text, lexer=lexer)
+            res = self._parser.parse(text, lexer=self._lexer)
         except Exception as err:
             msg = f'Failed to parse "{text}": {err}'
             LOGGER.error("%s", msg)
@@ -133,6 +133,12 @@ def can_unquote(text):
     return t_identity.regex.fullmatch(text) is not None
 
 
+class _StrSink(list):
+    """A minimal text sink which collects written fragments to be joined."""
+
+    write = list.append
+
+
 @dataclass
 class EncodeOptions:
     """Preferences for text encoding variations."""
@@ -165,6 +171,16 @@ class Encoder:
         """
         self._encode_obj(buf, obj, prefix=self._options.scheme_prefix)
 
+    def encode_str(self, obj: ARI) -> str:
+        """Encode an ARI into a text string.
+
+        :param obj: The ARI object to encode.
+        :return: The encoded text.
+        """
+        buf = _StrSink()
+        self._encode_obj(buf, obj, prefix=self._options.scheme_prefix)
+        return "".join(buf)
+
     def _encode_obj(self, buf: TextIO, obj: ARI, prefix: bool = False):
         if isinstance(obj, LiteralARI):
             LOGGER.debug("Encode literal %s", obj)
@@ -175,43 +191,9 @@ class Encoder:
                 buf.write(obj.type_id.name)
                 buf.write("/")
 
-            if obj.type_id is StructType.AC:
-                self._encode_list(buf, obj.value)
-            elif obj.type_id is StructType.AM:
-                self._encode_map(buf, obj.value)
-            elif obj.type_id is StructType.TBL:
-                self._encode_tbl(buf, obj.value)
-            elif obj.type_id is StructType.TP:
-                if self._options.time_text:
-                    text = encode_datetime(obj.value)
-                    buf.write(percent_encode(text))
-                else:
-                    text = encode_decfrac(obj.value)
-                    buf.write(text)
-            elif obj.type_id is StructType.TD:
-                if self._options.time_text:
-                    text = encode_timedelta(obj.value)
-                    buf.write(percent_encode(text))
-                else:
-                    text = encode_decfrac(obj.value)
-                    buf.write(text)
-            elif obj.type_id is StructType.LABEL:
-                # no need to percent_encode identity
-                buf.write(str(obj.value))
-            elif obj.type_id is StructType.CBOR:
-                if self._options.cbor_diag:
-                    buf.write(percent_encode("<<"))
-                    buf.write(percent_encode(to_diag(cbor2.loads(obj.value))))
-                    buf.write(percent_encode(">>"))
-                else:
-                    self._encode_bytes(buf, obj.value)
-            elif obj.type_id is StructType.ARITYPE:
-                # could be int or :py:cls:`StructType`
-                try:
-                    buf.write(StructType(obj.value).name)
-                except ValueError:
-                    # unknown type
-                    buf.write(str(int(obj.value)))
+            lit_enc = self._LITERAL_ENCODERS.get(obj.type_id)
+            if lit_enc is not None:
+                lit_enc(self, buf, obj.value)
             elif isinstance(obj.value, ExecutionSet):
                 params = {
                     "n": obj.value.nonce,
@@ -332,6 +314,41 @@ class Encoder:
         else:
             raise TypeError(f"Unhandled object type {type(obj)} instance: {obj}")
 
+    def _encode_bool(self, buf: TextIO, value: bool):
+        buf.write("true" if value else "false")
+
+    def _encode_tp(self, buf: TextIO, value: numpy.timedelta64):
+        if self._options.time_text:
+            buf.write(percent_encode(encode_datetime(value)))
+        else:
+            buf.write(encode_decfrac(value))
+
+    def _encode_td(self, buf: TextIO, value: numpy.timedelta64):
+        if self._options.time_text:
+            buf.write(percent_encode(encode_timedelta(value)))
+        else:
+            buf.write(encode_decfrac(value))
+
+    def _encode_label(self, buf: TextIO, value):
+        # no need to percent_encode identity
+        buf.write(str(value))
+
+    def _encode_cbor(self, buf: TextIO, value: bytes):
+        if self._options.cbor_diag:
+            buf.write(percent_encode("<<"))
+            buf.write(percent_encode(to_diag(cbor2.loads(value))))
+            buf.write(percent_encode(">>"))
+        else:
+            self._encode_bytes(buf, value)
+
+    def _encode_aritype(self, buf: TextIO, value):
+        # could be int or :py:cls:`StructType`
+        try:
+            buf.write(StructType(value).name)
+        except ValueError:
+            # unknown type
+            buf.write(str(int(value)))
+
     def _encode_bytes(self, buf: TextIO, value: bytes):
         # already guaranteed URL safe
         buf.write(f"h'{value.hex().upper()}'")
@@ -379,3 +396,16 @@ class Encoder:
             buf.write("=")
             self._encode_obj(buf, val, False)
             buf.write(";")
+
+    _LITERAL_ENCODERS = {
+        StructType.BOOL: _encode_bool,
+        StructType.AC: _encode_list,
+        StructType.AM: _encode_map,
+        StructType.TBL: _encode_tbl,
+        StructType.TP: _encode_tp,
+        StructType.TD: _encode_td,
+        StructType.LABEL: _encode_label,
+        StructType.CBOR: _encode_cbor,
+        StructType.ARITYPE: _encode_aritype,
+    }
+    """ Value encoders for literal types with a fixed text form, keyed by type ID. """
@@ -27,12 +27,13 @@ import datetime
 import decimal
 import logging
 import re
+import string
 from typing import List
 
 import cbor_diag
 import numpy
 
-from ace.ari import DTN_EPOCH, INT_ENVELOPE, UNDEFINED, StructType
+from ace.ari import DTN_EPOCH, INT_ENVELOPE, INT_ENVELOPE_MAX, INT_ENVELOPE_MIN, UNDEFINED, StructType
 
 LOGGER = logging.getLogger(__name__)
 
@@ -107,7 +108,8 @@ def t_floathex(found):
 def t_int(found):
     value = int(found[0], 0)
 
-    if value not in INT_ENVELOPE:
+    # plain comparisons avoid the cost of interval containment
+    if not INT_ENVELOPE_MIN <= value <= INT_ENVELOPE_MAX:
         raise ValueError(f"Integer value {value} is outside valid envelope {INT_ENVELOPE}")
 
     return value
@@ -174,6 +176,10 @@ def t_tstr(found):
     return unescape(found["val"])
 
 
+STRIP_SPACE = str.maketrans("", "", string.whitespace)
+""" Translation table to remove all whitespace from encoded bytes text. """
+
+
 @TypeMatch.apply(r"(?P<enc>h|b64)?\'(?P<val>(?:[^\']|\\.)*)\'")
 def t_bstr(found):
     enc = found["enc"]
@@ -181,13 +187,14 @@ def t_bstr(found):
 
     if enc == "h":
         # join space-separated hex values into a single string
-        val = "".join(val.split())
-        return base64.b16decode(val, casefold=True)
+        val = val.translate(STRIP_SPACE)
+        return bytes.fromhex(val)
     elif enc == "b64":
+        val = val.translate(STRIP_SPACE)
         rem = len(val) % 4
         if rem in {2, 3}:
             val += "=" * (4 - rem)
-        return base64.b64decode(val)
+        return base64.b64decode(val, validate=True)
     else:
         return bytes(unescape(val), "ascii")
 
@@ -210,6 +217,10 @@ def part_to_int(digits):
         return 0
 
 
+TD_NSEC_MAX = int(numpy.iinfo(numpy.int64).max)
+""" Largest time period magnitude in nanoseconds. """
+
+
 def subsec_to_nanoseconds(digits: str) -> int:
     """Convert sub-seconds text (after decimal point) into nanoseconds,
     defaulting to zero if the text is empty.
@@ -227,15 +238,8 @@ def subsec_to_nanoseconds(digits: str) -> int:
     r"(?P<yr>\d{4})\-?(?P<mon>\d{2})\-?(?P<dom>\d{2})T(?P<H>\d{2}):?(?P<M>\d{2}):?(?P<S>\d{2})(\.(?P<SS>\d+))?Z"
 )
 def t_timepoint(found):
-    # seconds-scale processing with datetime
-    secs = datetime.datetime(
-        year=part_to_int(found.group("yr")),
-        month=part_to_int(found.group("mon")),
-        day=part_to_int(found.group("dom")),
-        hour=part_to_int(found.group("H")),
-        minute=part_to_int(found.group("M")),
-        second=part_to_int(found.group("S")),
-    )
+    # seconds-scale processing with datetime, all of these parts are required
+    secs = datetime.datetime(*map(int, found.group("yr", "mon", "dom", "H", "M", "S")))
     # subseconds separately
     nsec = subsec_to_nanoseconds(found.group("SS"))
 
@@ -256,19 +260,14 @@ def t_timeperiod(found):
     minute = part_to_int(found.group("M"))
     second = part_to_int(found.group("S"))
     nsec = subsec_to_nanoseconds(found.group("SS"))
-    value = (
-        numpy.timedelta64(day, "D")
-        + numpy.timedelta64(hour, "h")
-        + numpy.timedelta64(minute, "m")
-        + numpy.timedelta64(second, "s")
-        + numpy.timedelta64(nsec, "ns")
-    )
-    if value < 0:
-        # internal overflow
+    # accumulate in python integers and convert to numpy only once
+    total = (((day * 24 + hour) * 60 + minute) * 60 + second) * 1_000_000_000 + nsec
+    if total > TD_NSEC_MAX:
         raise ValueError("Got overflow")
 
     if neg:
-        value = -value
+        total = -total
+    value = numpy.timedelta64(total, "ns")
 
     if numpy.isnat(value):
         raise ValueError("Got not-a-time")
@@ -291,7 +290,20 @@ SINGLETONS = TypeSeq(
 """ Types that match singleton values. """
 
 
+STRUCTTYPE_TEXT = {
+    **StructType.__members__,
+    **{str(int(typ)): typ for typ in StructType},
+}
+""" Canonical name and decimal forms of each :py:class:`StructType` """
+
+
 def get_structtype(text: str) -> StructType:
+    # common case of canonical text avoids the regex matching
+    try:
+        return STRUCTTYPE_TEXT[text]
+    except KeyError:
+        pass
+
     value = IDSEGMENT(text)
     if isinstance(value, int):
         return StructType(value)
@@ -20,9 +20,11 @@
 # under the prime contract 80NM0018D0004 between the Caltech and NASA under
 # subcontract 1658085.
 #
+import bisect
+import math
 import re
 from dataclasses import dataclass
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import cbor2
 import portion
@@ -74,11 +76,28 @@ class TextPattern(Constraint):
 
 @dataclass
 class NumericRange(Constraint):
-    """Limit the range of numeric values."""
+    """Limit the range of numeric values.
+    A NaN value is never within any range.
+    """
 
     ranges: portion.Interval
     """ The Interval representing valid ranges, integers or floats. """
 
+    def __post_init__(self):
+        self._flat = None
+
+    def _flatten(self) -> Tuple[List, Tuple]:
+        """Get the lower bounds and atomic intervals of :ivar:`ranges`,
+        flattened once for each assigned Interval object.
+
+        :return: The sorted lower bounds and the associated
+        (lower, upper, left, right) tuples.
+        """
+        if self._flat is None or self._flat[0] is not self.ranges:
+            atomics = tuple((intvl.lower, intvl.upper, intvl.left, intvl.right) for intvl in self.ranges)
+            self._flat = (self.ranges, [atomic[0] for atomic in atomics], atomics)
+        return self._flat[1:]
+
     def applicable(self) -> Set[StructType]:
         return set(
             [
@@ -94,10 +113,24 @@ class NumericRange(Constraint):
 
     def is_valid(self, obj: ARI) -> bool:
         if isinstance(obj.value, (int, float)):
-            return obj.value in self.ranges
+            return self._contains(obj.value)
         else:
             return False
 
+    def _contains(self, value) -> bool:
+        if isinstance(value, float) and math.isnan(value):
+            # not ordered relative to any bound
+            return False
+        # atomic intervals are sorted and disjoint, so only one can match
+        lowers, atomics = self._flatten()
+        ix = bisect.bisect_right(lowers, value) - 1
+        if ix < 0:
+            return False
+        lower, upper, left, right = atomics[ix]
+        return (lower < value or (left == portion.CLOSED and lower == value)) and (
+            value < upper or (right == portion.CLOSED and value == upper)
+        )
+
 
 @dataclass
 class IntegerEnums(Constraint):
@@ -29,7 +29,7 @@ import struct
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from functools import reduce
-from typing import List, Optional, Set, Type
+from typing import Iterable, List, Optional, Set, Type
 
 import numpy
 
@@ -101,6 +101,15 @@ class BaseType:
     def get(self, obj: ARI) -> Optional[ARI]:
         raise NotImplementedError()
 
+    def get_many(self, objs: Iterable[ARI]) -> List[Optional[ARI]]:
+        """Apply :meth:`get` to each of a sequence of values.
+
+        :param objs: The input ARIs.
+        :return: The result for each input, in the same order, with None
+            for any input not matching this type.
+        """
+        return [self.get(obj) for obj in objs]
+
     def convert(self, obj: ARI) -> ARI:
         """Force a literal conversion to this target type.
 
@@ -606,7 +615,14 @@ class TypeUnion(SemType):
     """A union of other types."""
 
     types: List[SemType] = field(default_factory=list)
-    """ The underlying types, with significant order. """
+    """ The underlying types, with significant order.
+    Assign a new list rather than modifying it in place. """
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "types":
+            # members which could match each literal type, built as needed
+            super().__setattr__("_by_type_id", {})
 
     def children(self) -> List["BaseType"]:
         return [typ for typ in self.types]
@@ -627,7 +643,7 @@ class TypeUnion(SemType):
         )
 
     def get(self, obj: ARI) -> Optional[ARI]:
-        for typ in self.types:
+        for typ in self._candidates(obj):
             try:
                 got = typ.get(obj)
             except (TypeError, ValueError):
@@ -636,6 +652,39 @@ class TypeUnion(SemType):
                 return got
         return None
 
+    def _candidates(self, obj: ARI) -> List[SemType]:
+        """Select the member types which can possibly match a value.
+        Only typed literal values are used to exclude members, and only
+        members restricted to specific literal types are ever excluded.
+        The selection is cached per literal type until :ivar:`types` is
+        assigned again, so the member list must not be modified in place.
+
+        :param obj: The value to match.
+        :return: The member types, in the original union order.
+        """
+        if not isinstance(obj, LiteralARI) or obj.type_id is None:
+            return self.types
+
+        found = self._by_type_id.get(obj.type_id)
+        if found is None:
+            found = [typ for typ in self.types if self._may_match(typ, obj.type_id)]
+            self._by_type_id[obj.type_id] = found
+        return found
+
+    @staticmethod
+    def _may_match(typ: SemType, type_id: StructType) -> bool:
+        """Determine if a member type can possibly match a literal type.
+
+        :param typ: The member type to check.
+        :param type_id: The literal type of a value.
+        :return: False only if the member is restricted to other literal types.
+        """
+        type_ids = typ.all_type_ids()
+        if not type_ids or type_id in type_ids:
+            return True
+        # aggregate types like "literal" accept values outside of their own ID
+        return not all(tid is not None and 0 <= tid < StructType.LITERAL for tid in type_ids)
+
     def convert(self, obj: ARI) -> ARI:
         if is_undefined(obj):
             return obj
@@ -1024,11 +1073,11 @@ class TableTemplate(SemType):
             LOGGER.debug("TableTemplate.get() invalid constraints: %s", err)
             return None
 
-        # check each value against column schema
-        nrows, _ = obj.value.shape
-        for row_ix in range(nrows):
-            for col_ix, col in enumerate(self.columns):
-                if col.base.get(obj.value[row_ix, col_ix]) is None:
+        # check each value against column schema, one whole column at a time
+        for col_ix, col in enumerate(self.columns):
+            col_get = col.base.get
+            for item in obj.value[:, col_ix].tolist():
+                if col_get(item) is None:
                     return None
 
         return obj
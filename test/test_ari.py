@@ -22,10 +22,12 @@
 #
 """Verify behavior of the :mod:`ace.ari` module."""
 
+import copy
 import logging
+import pickle
 import unittest
 
-from ace.ari import ARI, Identity, LiteralARI, ObjectRefPattern, ReferenceARI, StructType, apiIntInterval
+from ace.ari import ARI, Identity, LiteralARI, ObjectRefPattern, ReferenceARI, StructType, Table, apiIntInterval
 
 LOGGER = logging.getLogger(__name__)
 
@@ -107,6 +109,33 @@ class TestAri(unittest.TestCase):
         got = ari.map(IdentityMapper())
         self.assertEqual(ari, got)
 
+    def test_table_eq(self):
+        table = Table.from_rows([[LiteralARI(1), LiteralARI(float("nan"))]])
+
+        self.assertTrue(table == Table.from_rows([[LiteralARI(1), LiteralARI(float("nan"))]]))
+        self.assertFalse(table == Table.from_rows([[LiteralARI(1), LiteralARI(2.0)]]))
+        # same cells in a different shape
+        self.assertFalse(table == Table.from_rows([[LiteralARI(1)], [LiteralARI(float("nan"))]]))
+        self.assertTrue(Table((0, 3)) == Table((0, 3)))
+        self.assertFalse(Table((0, 3)) == Table((0, 2)))
+
+    def test_literal_hash_copy(self):
+        for ari in (
+            LiteralARI(True),
+            LiteralARI(10, StructType.INT),
+            LiteralARI("hi"),
+            LiteralARI(b"hi", StructType.BYTESTR),
+        ):
+            with self.subTest(f"{ari}"):
+                value = hash(ari)
+                self.assertIn("_hash", ari.__dict__)
+
+                for got in (pickle.loads(pickle.dumps(ari)), copy.deepcopy(ari)):
+                    # cached hash is not carried along
+                    self.assertNotIn("_hash", got.__dict__)
+                    self.assertEqual(ari, got)
+                    self.assertEqual(value, hash(got))
+
 
 class TestPatternLogic(unittest.TestCase):
     """Simple verification of OBJPAT internal logic"""
@@ -141,3 +170,20 @@ class TestPatternLogic(unittest.TestCase):
 
         ident = Identity(org_id=65535, model_id=1, type_id=StructType.EDD, obj_id=9)
         self.assertFalse(pat.is_match(ident))
+
+    def test_match_unbounded(self):
+        pat = ObjectRefPattern(
+            org_pat="example",
+            model_pat=apiIntInterval.closed(-apiIntInterval.inf, -1),
+            type_pat=True,
+            obj_pat=apiIntInterval.closed(10, apiIntInterval.inf),
+        )
+
+        ident = Identity(org_id="example", model_id=-1000, type_id=StructType.EDD, obj_id=2**40)
+        self.assertTrue(pat.is_match(ident))
+
+        ident = Identity(org_id="example", model_id=0, type_id=StructType.EDD, obj_id=2**40)
+        self.assertFalse(pat.is_match(ident))
+
+        ident = Identity(org_id="example", model_id="name", type_id=StructType.EDD, obj_id=10)
+        self.assertFalse(pat.is_match(ident))
@@ -22,47 +22,86 @@
 #
 """Test the adm_set module and AdmSet class."""
 
-import io
+import functools
 import logging
 import os
+import re
 import unittest
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from ace import ari, ari_text, constraints, models, typing
+from ace import ari, constraints, models, typing
+
+from .util import decode_text_cached
 
 SELFDIR = os.path.dirname(__file__)
 LOGGER = logging.getLogger(__name__)
 
+if os.environ.get("ACE_SQL_DEBUG"):
+    # opt-in logging of every SQL statement run by these tests
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
+_re_compile = functools.lru_cache(maxsize=64)(re.compile)
+""" Compile issue detail patterns once per distinct pattern. """
+
 
 class BaseTest(unittest.TestCase):
-    """Each test case run constructs a separate in-memory DB"""
+    """Each test class constructs a separate in-memory DB and each test case
+    run is isolated within a transaction which is rolled back afterward.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # one connection shared by all threads keeps the memory DB coherent
+        cls._db_eng = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+        # let SQLAlchemy emit BEGIN so that SAVEPOINT works with pysqlite
+        @event.listens_for(cls._db_eng, "connect")
+        def do_connect(dbapi_connection, _connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(cls._db_eng, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        models.Base.metadata.create_all(cls._db_eng)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._db_eng.dispose()
+        cls._db_eng = None
 
     def setUp(self):
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-        self._db_eng = create_engine("sqlite:///:memory:")
-        models.Base.metadata.create_all(self._db_eng)
-        self._db_sess = Session(self._db_eng, autoflush=False)
+        self._db_conn = self._db_eng.connect()
+        self._db_trans = self._db_conn.begin()
+        self._db_sess = Session(bind=self._db_conn, autoflush=False)
+        # session commits only end a savepoint within the outer transaction
+        self._db_nested = self._db_conn.begin_nested()
 
-        self._ari_dec = ari_text.Decoder()
+        @event.listens_for(self._db_sess, "after_transaction_end")
+        def end_savepoint(_session, _transaction):
+            if not self._db_nested.is_active:
+                self._db_nested = self._db_conn.begin_nested()
 
     def tearDown(self):
-        self._ari_dec = None
-
         self._db_sess.close()
         self._db_sess = None
-        models.Base.metadata.drop_all(self._db_eng)
-        self._db_eng = None
+        self._db_nested = None
+        self._db_trans.rollback()
+        self._db_trans = None
+        self._db_conn.close()
+        self._db_conn = None
 
     def assertIssuePattern(self, issue: constraints.Issue, module_name, check_name, obj_ref, detail_re):
         self.assertEqual(module_name, issue.module_name)
         self.assertEqual(check_name, issue.check_name)
         self.assertEqual(obj_ref, issue.obj)
-        self.assertRegex(issue.detail, detail_re)
+        self.assertRegex(issue.detail, _re_compile(detail_re))
 
     def _from_text(self, text: str) -> ari.ARI:
-        return self._ari_dec.decode(io.StringIO(text))
+        return decode_text_cached(text)
 
     def _get_typeuse(self, text: str) -> typing.TypeUse:
         return typing.TypeUse(
@@ -103,7 +142,7 @@ class TestConstraintsBasic(BaseTest):
             model_name="myadm",
             model_enum=200,
         )
-        self._db_sess.commit()
+        self._db_sess.flush()
 
         eng = constraints.Checker(self._db_sess)
         issues = eng.check(adm)
@@ -135,7 +174,7 @@ class TestConstraintsBasic(BaseTest):
             model_enum=201,
         )
         self.assertIsInstance(adm_b, models.AdmModule)
-        self._db_sess.commit()
+        self._db_sess.flush()
 
         eng = constraints.Checker(self._db_sess)
         issues = eng.check()
@@ -159,7 +198,7 @@ class TestConstraintsBasic(BaseTest):
         )
         adm.ctrl.append(models.Ctrl(name="control_a", norm_name="control_a"))
         adm.ctrl.append(models.Ctrl(name="control_a", norm_name="control_a"))
-        self._db_sess.commit()
+        self._db_sess.flush()
 
         eng = constraints.Checker(self._db_sess)
         issues = eng.check(adm)
@@ -187,7 +226,7 @@ class TestConstraintsBasic(BaseTest):
                 name="someval", typeobj=typing.TypeUse(type_ari="asdf"), init_value=val, init_ari=self._from_text(val)
             )
         )
-        self._db_sess.commit()
+        self._db_sess.flush()
 
         eng = constraints.Checker(self._db_sess)
         issues = eng.check(adm)
@@ -230,7 +269,7 @@ class TestConstraintsBasic(BaseTest):
             )
         )
 
-        self._db_sess.commit()
+        self._db_sess.flush()
 
         eng = constraints.Checker(self._db_sess)
         issues = eng.check(adm_a)
@@ -285,7 +324,7 @@ class TestConstraintsBasic(BaseTest):
             ]
         )
 
-        self._db_sess.commit()
+        self._db_sess.flush()
 
         eng = constraints.Checker(self._db_sess)
         issues = eng.check(adm_a)
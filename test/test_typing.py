@@ -23,6 +23,8 @@
 """Test the mod:`ace.typing` module."""
 
 import logging
+import os
+import timeit
 import unittest
 
 import portion
@@ -65,15 +67,43 @@ LOGGER = logging.getLogger(__name__)
 
 
 class TestTyping(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # type objects are not modified by get() or convert()
+        cls._int_range_typ = TypeUse(
+            base=BUILTINS["int"], constraints=[NumericRange(portion.closed(1, 10) | portion.closed(20, 25))]
+        )
+        cls._textstr_length_typ = TypeUse(
+            base=BUILTINS["textstr"], constraints=[StringLength(portion.closed(1, 10) | portion.closed(20, 25))]
+        )
+        # literal inputs and converted outputs for the range tests
+        cls._range_in = {val: LiteralARI(val) for val in range(-10, 30)}
+        cls._range_out = {val: LiteralARI(val, StructType.INT) for val in range(-10, 30)}
+        cls._bool_null_union = TypeUnion(types=[BUILTINS["bool"], BUILTINS["null"]])
+        cls._tblt = TableTemplate(
+            columns=[
+                TableColumn(name="one", base=BUILTINS["int"]),
+                TableColumn(name="two", base=BUILTINS["textstr"]),
+                TableColumn(name="three", base=BUILTINS["bool"]),
+            ]
+        )
+        # tables which match the template columns, copy before modifying
+        cls._tblt_in = Table.from_rows([[LiteralARI(1), LiteralARI("hi"), LiteralARI(True)]])
+        cls._tblt_out = Table.from_rows(
+            [[LiteralARI(1, StructType.INT), LiteralARI("hi", StructType.TEXTSTR), LiteralARI(True, StructType.BOOL)]]
+        )
+
     def test_builtin_get_undefined(self):
         for name, typ in BUILTINS.items():
-            LOGGER.info("Testing %s: %s", name, typ)
-            self.assertIsNone(typ.get(UNDEFINED))
+            with self.subTest(name):
+                LOGGER.info("Testing %s: %s", name, typ)
+                self.assertIsNone(typ.get(UNDEFINED))
 
     def test_builtin_convert_undefined(self):
         for name, typ in BUILTINS.items():
-            LOGGER.info("Testing %s: %s", name, typ)
-            self.assertEqual(UNDEFINED, typ.convert(UNDEFINED))
+            with self.subTest(name):
+                LOGGER.info("Testing %s: %s", name, typ)
+                self.assertEqual(UNDEFINED, typ.convert(UNDEFINED))
 
     def test_bool_get(self):
         typ = BUILTINS["bool"]
@@ -390,49 +420,68 @@ class TestTyping(unittest.TestCase):
         ref = ReferenceARI(Identity())
         self.assertEqual(ref, typ.convert(ref))
 
+    INT_RANGE_PARTS = (
+        (-10, 1, False),
+        (1, 11, True),
+        (11, 20, False),
+        (20, 26, True),
+        (26, 30, False),
+    )
+    """ Half-open value ranges and whether they are within the int range type """
+
     def test_typeuse_int_range_get(self):
-        typ = TypeUse(base=BUILTINS["int"], constraints=[NumericRange(portion.closed(1, 10) | portion.closed(20, 25))])
+        typ = self._int_range_typ
 
         self.assertIsNone(typ.get(UNDEFINED))
         self.assertIsNone(typ.get(TRUE))
         self.assertIsNone(typ.get(FALSE))
 
-        for val in range(-10, 1):
-            self.assertIsNone(typ.get(LiteralARI(val)))
-        for val in range(1, 11):
-            self.assertEqual(LiteralARI(val), typ.get(LiteralARI(val)))
-        for val in range(11, 20):
-            self.assertIsNone(typ.get(LiteralARI(val)))
-        for val in range(20, 26):
-            self.assertEqual(LiteralARI(val), typ.get(LiteralARI(val)))
-        for val in range(26, 30):
-            self.assertIsNone(typ.get(LiteralARI(val)))
+        got = dict(zip(self._range_in, typ.get_many(self._range_in.values())))
+        for lower, upper, valid in self.INT_RANGE_PARTS:
+            with self.subTest(f"range {lower}..{upper - 1}"):
+                expect = [self._range_in[val] if valid else None for val in range(lower, upper)]
+                self.assertEqual(expect, [got[val] for val in range(lower, upper)])
 
     def test_typeuse_int_range_convert(self):
-        typ = TypeUse(base=BUILTINS["int"], constraints=[NumericRange(portion.closed(1, 10) | portion.closed(20, 25))])
+        typ = self._int_range_typ
 
         self.assertEqual(UNDEFINED, typ.convert(UNDEFINED))
         self.assertEqual(LiteralARI(1, StructType.INT), typ.convert(TRUE))
 
-        for val in range(-10, 1):
-            with self.assertRaises(ValueError):
-                typ.convert(LiteralARI(val))
-        for val in range(1, 11):
-            self.assertEqual(LiteralARI(val, StructType.INT), typ.convert(LiteralARI(val)))
-        for val in range(11, 20):
-            with self.assertRaises(ValueError):
-                typ.convert(LiteralARI(val))
-        for val in range(20, 26):
-            self.assertEqual(LiteralARI(val, StructType.INT), typ.convert(LiteralARI(val)))
-        for val in range(26, 30):
-            with self.assertRaises(ValueError):
-                typ.convert(LiteralARI(val))
-
-    def test_typeuse_textstr_length_get(self):
+        for lower, upper, valid in self.INT_RANGE_PARTS:
+            with self.subTest(f"range {lower}..{upper - 1}"):
+                if valid:
+                    expect = [self._range_out[val] for val in range(lower, upper)]
+                    self.assertEqual(expect, [typ.convert(self._range_in[val]) for val in range(lower, upper)])
+                else:
+                    for val in range(lower, upper):
+                        with self.assertRaises(ValueError):
+                            typ.convert(self._range_in[val])
+
+    def test_typeuse_real_range_get(self):
         typ = TypeUse(
-            base=BUILTINS["textstr"], constraints=[StringLength(portion.closed(1, 10) | portion.closed(20, 25))]
+            base=BUILTINS["real64"], constraints=[NumericRange(portion.open(-portion.inf, 0) | portion.closed(1.5, 2))]
         )
 
+        for val, valid in ((-1e9, True), (0.0, False), (1.0, False), (1.5, True), (2.0, True), (2.5, False)):
+            with self.subTest(f"{val}"):
+                ari = LiteralARI(val, StructType.REAL64)
+                self.assertEqual(ari if valid else None, typ.get(ari))
+        # NaN is not within any range
+        self.assertIsNone(typ.get(LiteralARI(float("nan"), StructType.REAL64)))
+
+    def test_numeric_range_reassign(self):
+        cnst = NumericRange(portion.closed(1, 10))
+        self.assertTrue(cnst.is_valid(LiteralARI(5)))
+        self.assertFalse(cnst.is_valid(LiteralARI(150)))
+
+        cnst.ranges = portion.closed(100, 200)
+        self.assertFalse(cnst.is_valid(LiteralARI(5)))
+        self.assertTrue(cnst.is_valid(LiteralARI(150)))
+
+    def test_typeuse_textstr_length_get(self):
+        typ = self._textstr_length_typ
+
         self.assertIsNone(typ.get(UNDEFINED))
         self.assertIsNone(typ.get(TRUE))
         self.assertIsNone(typ.get(FALSE))
@@ -454,9 +503,7 @@ class TestTyping(unittest.TestCase):
             self.assertIsNone(typ.get(val))
 
     def test_typeuse_textstr_length_convert(self):
-        typ = TypeUse(
-            base=BUILTINS["textstr"], constraints=[StringLength(portion.closed(1, 10) | portion.closed(20, 25))]
-        )
+        typ = self._textstr_length_typ
 
         self.assertEqual(UNDEFINED, typ.convert(UNDEFINED))
         with self.assertRaises(TypeError):
@@ -487,7 +534,7 @@ class TestTyping(unittest.TestCase):
                     typ.convert(val)
 
     def test_union_get(self):
-        typ = TypeUnion(types=[BUILTINS["bool"], BUILTINS["null"]])
+        typ = self._bool_null_union
 
         self.assertIsNone(typ.get(UNDEFINED))
         self.assertEqual(TRUE, typ.get(TRUE))
@@ -497,8 +544,25 @@ class TestTyping(unittest.TestCase):
         self.assertIsNone(typ.get(LiteralARI("hi")))
         self.assertIsNone(typ.get(LiteralARI(123)))
 
+    def test_union_get_typed(self):
+        names = ["null", "bool", "int", "uint", "vast", "real64", "textstr", "bytestr", "tp", "td"]
+        typ = TypeUnion(types=[BUILTINS[name] for name in names])
+
+        for val in (TYPED_TRUE, LiteralARI(3, StructType.UINT), LiteralARI("hi", StructType.TEXTSTR)):
+            with self.subTest(f"{val}"):
+                self.assertEqual(val, typ.get(val))
+        # type ID outside of all members
+        self.assertIsNone(typ.get(LiteralARI(3, StructType.UVAST)))
+        # untyped values still use union order
+        self.assertEqual(LiteralARI(3), typ.get(LiteralARI(3)))
+
+        # aggregate member accepts any literal, in union order
+        typ.types = typ.types + [BUILTINS["literal"]]
+        self.assertEqual(LiteralARI(3, StructType.UVAST), typ.get(LiteralARI(3, StructType.UVAST)))
+        self.assertEqual(TYPED_TRUE, typ.get(TYPED_TRUE))
+
     def test_union_convert(self):
-        typ = TypeUnion(types=[BUILTINS["bool"], BUILTINS["null"]])
+        typ = self._bool_null_union
 
         self.assertEqual(UNDEFINED, typ.convert(UNDEFINED))
         self.assertEqual(NULL, typ.convert(NULL))
@@ -776,13 +840,7 @@ class TestTyping(unittest.TestCase):
             )
 
     def test_tblt_get(self):
-        typ = TableTemplate(
-            columns=[
-                TableColumn(name="one", base=BUILTINS["int"]),
-                TableColumn(name="two", base=BUILTINS["textstr"]),
-                TableColumn(name="three", base=BUILTINS["bool"]),
-            ]
-        )
+        typ = self._tblt
 
         self.assertIsNone(typ.get(NULL))
         self.assertIsNone(typ.get(TRUE))
@@ -806,11 +864,7 @@ class TestTyping(unittest.TestCase):
         self.assertEqual(StructType.TBL, got.type_id)
         self.assertEqual(inarray, got.value)
 
-        inarray = Table.from_rows(
-            [
-                [LiteralARI(1), LiteralARI("hi"), LiteralARI(True)],
-            ]
-        )
+        inarray = self._tblt_in
         LOGGER.info("in %s", inarray)
         got = typ.get(LiteralARI(inarray, StructType.TBL))
         self.assertIsNotNone(got)
@@ -819,6 +873,7 @@ class TestTyping(unittest.TestCase):
         self.assertEqual(inarray, got.value)
 
         # mismatched value type in last column
+        inarray = self._tblt_in.copy()
         self.assertEqual(LiteralARI(True), inarray[0, 2])
         inarray[0, 2] = LiteralARI(3)
         LOGGER.info("in %s", inarray)
@@ -826,34 +881,15 @@ class TestTyping(unittest.TestCase):
         self.assertIsNone(got)
 
     def test_tblt_convert(self):
-        typ = TableTemplate(
-            columns=[
-                TableColumn(name="one", base=BUILTINS["int"]),
-                TableColumn(name="two", base=BUILTINS["textstr"]),
-                TableColumn(name="three", base=BUILTINS["bool"]),
-            ]
-        )
+        typ = self._tblt
 
-        inarray = Table.from_rows(
-            [
-                [LiteralARI(1), LiteralARI("hi"), LiteralARI(True)],
-            ]
-        )
+        inarray = self._tblt_in
         LOGGER.info("in %s", inarray)
         got = typ.convert(LiteralARI(inarray, StructType.TBL))
         self.assertIsNotNone(got)
         self.assertEqual(StructType.TBL, got.type_id)
         LOGGER.info("out %s", got.value)
-        outarray = Table.from_rows(
-            [
-                [
-                    LiteralARI(1, StructType.INT),
-                    LiteralARI("hi", StructType.TEXTSTR),
-                    LiteralARI(True, StructType.BOOL),
-                ],
-            ]
-        )
-        self.assertEqual(outarray, got.value)
+        self.assertEqual(self._tblt_out, got.value)
 
         inarray = Table.from_rows(
             [
@@ -865,16 +901,7 @@ class TestTyping(unittest.TestCase):
         self.assertIsNotNone(got)
         self.assertEqual(StructType.TBL, got.type_id)
         LOGGER.info("out %s", got.value)
-        outarray = Table.from_rows(
-            [
-                [
-                    LiteralARI(1, StructType.INT),
-                    LiteralARI("hi", StructType.TEXTSTR),
-                    LiteralARI(True, StructType.BOOL),
-                ],
-            ]
-        )
-        self.assertEqual(outarray, got.value)
+        self.assertEqual(self._tblt_out, got.value)
 
     def test_seq_take(self):
         typ = Sequence(
@@ -946,3 +973,16 @@ class TestTyping(unittest.TestCase):
                 root, expect = row
                 got = [TypeSummary.from_type(obj) for obj in type_walk(root)]
                 self.assertEqual(expect, got)
+
+
+@unittest.skipUnless(os.environ.get("RUN_PERF"), "performance checks only run when RUN_PERF is set")
+class TestTypingPerf(unittest.TestCase):
+    """Coarse time limits on frequently used type checks."""
+
+    def test_typeuse_int_range_convert(self):
+        typ = TypeUse(base=BUILTINS["int"], constraints=[NumericRange(portion.closed(1, 10) | portion.closed(20, 25))])
+        lit = LiteralARI(5)
+
+        elapsed = timeit.timeit(lambda: typ.convert(lit), number=100_000)
+        LOGGER.info("Converted %d values in %f s", 100_000, elapsed)
+        self.assertLess(elapsed, 0.5)
@@ -22,11 +22,27 @@
 #
 """Shared test fixture utilities."""
 
+import functools
 import os
 import tempfile
 from dataclasses import dataclass
 
-from ace import typing
+from ace import ari_text, typing
+from ace.ari import ARI
+
+TEXT_DECODER = ari_text.Decoder()
+""" Default text decoder shared among test modules """
+
+
+@functools.lru_cache(maxsize=1024)
+def decode_text_cached(text: str) -> ARI:
+    """Decode text with :data:`TEXT_DECODER`, reusing the result for
+    repeated texts. Callers must treat the result as read-only.
+
+    :param text: The ARI text to decode.
+    :return: The decoded ARI.
+    """
+    return TEXT_DECODER.decode_str(text)
 
 
 class TmpDir: